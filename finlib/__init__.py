@@ -1,5 +1,5 @@
 # Define the __all__ variable
-__all__ = ["trade_direction","pin_measure","volatility_measures","liquidity_measures","investment_metrics"]
+__all__ = ["trade_direction","pin_measure","volatility_measures","liquidity_measures","investment_metrics","tick_batch"]
 
 # Import the submodules
 from . import trade_direction
@@ -7,3 +7,4 @@ from . import pin_measure
 from . import volatility_measures
 from . import liquidity_measures
 from . import investment_metrics
+from . import tick_batch
@@ -0,0 +1,30 @@
+"""Ahead-of-time build of the finlib kernels.
+
+Run ``python -m finlib._aot_build`` once (numba required) to produce the
+``finlib_native`` extension module next to this file. ``_numba_kernels`` then
+imports the kernels from it instead of JIT-compiling them.
+"""
+
+import os
+
+from ._numba_kernels import AOT_EXPORTS
+
+
+def build(output_dir: str = os.path.dirname(os.path.abspath(__file__))) -> None:
+    """Compile the exported kernels into the ``finlib_native`` extension.
+
+    Args:
+        output_dir (str, optional): Directory for the extension module.
+            Defaults to the finlib package directory
+    """
+    from numba.pycc import CC
+
+    cc = CC("finlib_native")
+    cc.output_dir = output_dir
+    for name, (kernel, signature) in AOT_EXPORTS.items():
+        cc.export(name, signature)(kernel)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
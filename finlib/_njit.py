@@ -0,0 +1,25 @@
+"""Optional numba support.
+
+Re-exports ``njit`` and ``prange`` from numba when it is installed. Without
+numba, ``njit`` becomes a no-op decorator and ``prange`` falls back to
+``range`` so the kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with signature/options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
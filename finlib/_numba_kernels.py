@@ -0,0 +1,165 @@
+"""Compiled inner loops used by the public finlib functions.
+
+Kernels expect validated, contiguous arrays of the declared dtype; the public
+wrappers are responsible for checks and conversions.
+
+Every kernel is compiled with ``cache=True`` so later processes load the
+machine code from ``__pycache__`` instead of recompiling. When the
+ahead-of-time module built by ``python -m finlib._aot_build`` is present, the
+tick-test and PIN likelihood kernels come from it and are never JIT-compiled;
+the remaining kernels (chunked tick test, rolling Sharpe ratio, effective
+spread) are then compiled lazily on first call instead of at import.
+"""
+
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit, prange
+
+try:
+    from . import finlib_native as _native
+except ImportError:
+    _native = None
+
+# Read-only float64 vector, e.g. Series.to_numpy() under pandas copy-on-write
+_RO_F8 = "Array(float64, 1, 'C', readonly=True)"
+
+
+def _jit(signatures, **options):
+    """njit with eager signatures, or lazy compilation when the AOT module is present."""
+    if _native is not None:
+        return njit(**options)
+    return njit(signatures, **options)
+
+
+def _tick_direction_py(prices):
+    n = prices.shape[0]
+    direction = np.zeros(n, dtype=np.int8)
+
+    for i in range(1, n):
+        # +1 uptick, -1 downtick, 0 zero tick, computed without branching
+        d = np.int8(prices[i] > prices[i - 1]) - np.int8(prices[i] < prices[i - 1])
+        # A zero tick inherits the previous direction (zero-uptick / zero-downtick)
+        direction[i] = d if d != 0 else direction[i - 1]
+
+    direction[0] = 0  # undefined for the first trade
+    return direction
+
+
+# Prices per chunk in the parallel tick test
+TICK_CHUNK_SIZE = 1 << 16
+
+
+@_jit(["int8[::1](float64[::1], int64)", f"int8[::1]({_RO_F8}, int64)"], parallel=True, cache=True)
+def _tick_direction_chunked(prices, chunk_size):
+    n = prices.shape[0]
+    direction = np.zeros(n, dtype=np.int8)
+    n_chunks = (n + chunk_size - 1) // chunk_size
+
+    # Each chunk runs the tick test independently, with no carry into its leading zero ticks
+    for c in prange(n_chunks):
+        carry = 0
+        for i in range(max(c * chunk_size, 1), min((c + 1) * chunk_size, n)):
+            d = np.int8(prices[i] > prices[i - 1]) - np.int8(prices[i] < prices[i - 1])
+            carry = d if d != 0 else carry
+            direction[i] = carry
+
+    # Leading zero ticks of a chunk inherit the final direction of the chunk before it
+    for c in range(1, n_chunks):
+        start = c * chunk_size
+        carry = direction[start - 1]
+        end = min(start + chunk_size, n)
+        i = start
+        while carry != 0 and i < end and direction[i] == 0:
+            direction[i] = carry
+            i += 1
+
+    return direction
+
+
+@njit(cache=True)
+def _effective_spread(prices, bids, asks, trade_directions):
+    # Narrow (int8) directions are widened per element rather than into a temporary array
+    total = 0.0
+    for i in range(prices.shape[0]):
+        total += trade_directions[i] * (2.0 * prices[i] - bids[i] - asks[i])
+    return total / prices.shape[0]
+
+
+@njit(cache=True)
+def _effective_spread_mid(prices, mid_prices, trade_directions):
+    # Same reduction as _effective_spread, against precomputed midpoints
+    total = 0.0
+    for i in range(prices.shape[0]):
+        total += trade_directions[i] * (prices[i] - mid_prices[i])
+    return 2.0 * total / prices.shape[0]
+
+
+@njit(cache=True)
+def _poisson_log_kernel(k, lam):
+    # log of lam**k * exp(-lam), i.e. the Poisson log-pmf without the -log(k!) term
+    return k * np.log(lam) - lam
+
+
+def _pin_nll_grad_py(alpha, mu, epsilon_b, epsilon_s, buys, sells, log_norm):
+    # Unnormalized Poisson log-pmfs for each day. Every branch of the mixture
+    # multiplies one buy pmf by one sell pmf, so the -log(b!) - log(s!) terms
+    # factor out of the sum; log_norm is their precomputed total.
+    log_t1 = _poisson_log_kernel(buys, mu + epsilon_b)
+    log_t2 = _poisson_log_kernel(sells, epsilon_s)
+    log_t3 = _poisson_log_kernel(buys, epsilon_b)
+    log_t4 = _poisson_log_kernel(sells, mu + epsilon_s)
+    # Good news, bad news and no-information branches, weighted by their priors
+    log_good = np.log(alpha) + log_t1 + log_t2
+    log_bad = np.log(alpha) + log_t3 + log_t4
+    log_none = np.log1p(-alpha) + log_t3 + log_t2
+    log_day = np.logaddexp(np.logaddexp(log_good, log_bad), log_none)
+    nll = log_norm - np.sum(log_day)
+
+    # Posterior branch probabilities for each day
+    w_good = np.exp(log_good - log_day)
+    w_bad = np.exp(log_bad - log_day)
+    w_none = np.exp(log_none - log_day)
+
+    # Derivatives of the Poisson log-pmfs with respect to their rates
+    d_b_informed = buys / (mu + epsilon_b) - 1.0
+    d_b_uninformed = buys / epsilon_b - 1.0
+    d_s_informed = sells / (mu + epsilon_s) - 1.0
+    d_s_uninformed = sells / epsilon_s - 1.0
+
+    grad = np.empty(4)
+    grad[0] = -np.sum((w_good + w_bad) / alpha - w_none / (1.0 - alpha))
+    grad[1] = -np.sum(w_good * d_b_informed + w_bad * d_s_informed)
+    grad[2] = -np.sum(w_good * d_b_informed + (w_bad + w_none) * d_b_uninformed)
+    grad[3] = -np.sum((w_good + w_none) * d_s_uninformed + w_bad * d_s_informed)
+    return nll, grad
+
+
+@_jit(["float64[::1](float64[::1], int64, float64)", f"float64[::1]({_RO_F8}, int64, float64)"],
+      parallel=True, cache=True)
+def _rolling_sharpe(returns, window, risk_free_rate):
+    out = np.empty(returns.shape[0] - window + 1)
+    for i in prange(out.shape[0]):
+        s = returns[i:i + window]
+        std_dev = s.std()
+        # Flat windows have no defined Sharpe ratio
+        out[i] = np.nan if std_dev == 0 else (s.mean() - risk_free_rate) / std_dev
+    return out
+
+
+# Kernels exported by _aot_build, with the signatures they are compiled for
+AOT_EXPORTS = {
+    "tick_direction": (_tick_direction_py, "i1[::1](f8[::1])"),
+    "pin_nll_grad": (_pin_nll_grad_py, "Tuple((f8, f8[::1]))(f8, f8, f8, f8, f8[::1], f8[::1], f8)"),
+}
+
+if _native is not None:
+    _tick_direction = _native.tick_direction
+    _pin_nll_grad = _native.pin_nll_grad
+else:
+    _tick_direction = njit(["int8[::1](float64[::1])", f"int8[::1]({_RO_F8})"], cache=True)(_tick_direction_py)
+    _pin_nll_grad = njit(
+        "Tuple((float64, float64[::1]))(float64, float64, float64, float64, float64[::1], float64[::1], float64)",
+        cache=True)(_pin_nll_grad_py)
+
+# Whether the kernels run as machine code rather than interpreted Python
+COMPILED = NUMBA_AVAILABLE or _native is not None
@@ -5,7 +5,8 @@ including CAGR, ROI, Sharpe Ratio, Volatility calculations and visualization.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+
+from ._numba_kernels import _rolling_sharpe
 
 
 def cagr(start_value, end_value, periods):
@@ -17,19 +18,16 @@ def cagr(start_value, end_value, periods):
         periods (float): Number of periods (usually years)
 
     Returns:
-        float: CAGR as a decimal, or error message if calculation fails
+        float: CAGR as a decimal
 
     Raises:
         ValueError: If any input is not positive
     """
-    try:
-        # Validate inputs are positive
-        if start_value <= 0 or end_value <= 0 or periods <= 0:
-            raise ValueError("All inputs must be positive numbers.")
-        # Calculate CAGR using the standard formula
-        return (end_value / start_value) ** (1 / periods) - 1
-    except Exception as e:
-        return f"CAGR calculation error: {e}"
+    # Validate inputs are positive
+    if start_value <= 0 or end_value <= 0 or periods <= 0:
+        raise ValueError("All inputs must be positive numbers.")
+    # Calculate CAGR using the standard formula
+    return (end_value / start_value) ** (1 / periods) - 1
 
 def roi(gain, cost):
     """Calculate Return on Investment (ROI).
@@ -39,18 +37,15 @@ def roi(gain, cost):
         cost (float): Initial cost of investment
 
     Returns:
-        float: ROI as a decimal, or error message if calculation fails
+        float: ROI as a decimal
 
     Raises:
         ZeroDivisionError: If cost is zero
     """
-    try:
-        if cost == 0:
-            raise ZeroDivisionError("Cost of investment cannot be zero.")
-        # Calculate ROI as (gain - cost) / cost
-        return (gain - cost) / cost
-    except Exception as e:
-        return f"ROI calculation error: {e}"
+    if cost == 0:
+        raise ZeroDivisionError("Cost of investment cannot be zero.")
+    # Calculate ROI as (gain - cost) / cost
+    return (gain - cost) / cost
 
 def sharpe_ratio(returns, risk_free_rate=0.01):
     """Calculate Sharpe Ratio for a set of returns.
@@ -60,22 +55,42 @@ def sharpe_ratio(returns, risk_free_rate=0.01):
         risk_free_rate (float, optional): Risk-free rate. Defaults to 0.01
 
     Returns:
-        float: Sharpe ratio, or error message if calculation fails
+        float: Sharpe ratio
 
     Raises:
         ValueError: If standard deviation of returns is zero
     """
-    try:
-        # Calculate excess returns over risk-free rate
-        excess_returns = np.array(returns) - risk_free_rate
-        # Calculate standard deviation of returns
-        std_dev = np.std(returns)
-        if std_dev == 0:
-            raise ValueError("Standard deviation of returns is zero.")
-        # Calculate Sharpe ratio
-        return np.mean(excess_returns) / std_dev
-    except Exception as e:
-        return f"Sharpe Ratio error: {e}"
+    # Arrays pass through without a copy
+    returns = np.asarray(returns, dtype=np.float64)
+    # Calculate standard deviation of returns
+    std_dev = returns.std()
+    if std_dev == 0:
+        raise ValueError("Standard deviation of returns is zero.")
+    # Mean excess return equals mean return minus the risk-free rate
+    return (returns.mean() - risk_free_rate) / std_dev
+
+def rolling_sharpe(returns, window, risk_free_rate=0.01):
+    """Calculate the Sharpe Ratio over every rolling window of returns.
+
+    Args:
+        returns (array-like): Array of investment returns
+        window (int): Number of returns in each window
+        risk_free_rate (float, optional): Risk-free rate. Defaults to 0.01
+
+    Returns:
+        np.ndarray: Sharpe ratio of returns[i:i + window] at position i
+            (NaN where the window has zero standard deviation)
+
+    Raises:
+        TypeError: If window is not an integer
+        ValueError: If window is not between 1 and the number of returns
+    """
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    if isinstance(window, bool) or not isinstance(window, (int, np.integer)):
+        raise TypeError("Window must be an integer.")
+    if window < 1 or window > returns.size:
+        raise ValueError("Window must be between 1 and the number of returns.")
+    return _rolling_sharpe(returns, int(window), float(risk_free_rate))
 
 def calculate_volatility(prices):
     """Calculate volatility from a series of prices.
@@ -84,16 +99,12 @@ def calculate_volatility(prices):
         prices (pd.Series): Time series of prices
 
     Returns:
-        float: Volatility measure (standard deviation of log returns),
-              or error message if calculation fails
+        float: Volatility measure (standard deviation of log returns)
     """
-    try:
-        # Calculate log returns
-        returns = np.log(prices / prices.shift(1)).dropna()
-        # Return standard deviation of returns as volatility measure
-        return np.std(returns)
-    except Exception as e:
-        return f"Volatility calculation error: {e}"
+    # Calculate log returns as differences of log prices
+    returns = np.diff(np.log(np.asarray(prices, dtype=np.float64)))
+    # Return standard deviation of returns as volatility measure
+    return float(np.std(returns))
 
 def plot_price_and_returns(prices):
     """Create a visualization of prices and returns.
@@ -104,9 +115,12 @@ def plot_price_and_returns(prices):
     Displays:
         A figure with two subplots showing prices and log returns
     """
+    # Imported here so the metric functions do not pay pyplot's import cost
+    import matplotlib.pyplot as plt
+
     try:
-        # Calculate log returns from prices
-        returns = np.log(prices / prices.shift(1)).dropna()
+        # Calculate log returns from prices, aligned with the second price onwards
+        returns = pd.Series(np.diff(np.log(prices.to_numpy(dtype=np.float64))), index=prices.index[1:])
         # Create subplot figure
         fig, axs = plt.subplots(2, 1, figsize=(10, 6))
         # Plot prices in top subplot
@@ -122,17 +136,39 @@ def plot_price_and_returns(prices):
 
 
 def test_cagr():
+    import pytest
+
     assert abs(cagr(1000, 2000, 3) - 0.259921) < 1e-5
-    assert cagr(1000, 0, 3) == "CAGR calculation error: All inputs must be positive numbers."
+    with pytest.raises(ValueError, match="All inputs must be positive numbers."):
+        cagr(1000, 0, 3)
 
 def test_roi():
+    import pytest
+
     assert abs(roi(1500, 1000) - 0.5) < 1e-5
-    assert roi(1500, 0) == "ROI calculation error: Cost of investment cannot be zero."
+    with pytest.raises(ZeroDivisionError, match="Cost of investment cannot be zero."):
+        roi(1500, 0)
 
 def test_sharpe_ratio():
+    import pytest
+
     returns = [0.05, 0.10, 0.02, 0.08, 0.04]
     assert abs(sharpe_ratio(returns) - 0.707107) < 1e-5
-    assert sharpe_ratio([0.01, 0.01, 0.01]) == "Sharpe Ratio error: Standard deviation of returns is zero."
+    with pytest.raises(ValueError, match="Standard deviation of returns is zero."):
+        sharpe_ratio([0.01, 0.01, 0.01])
+
+def test_rolling_sharpe():
+    import pytest
+
+    returns = np.array([0.05, 0.10, 0.02, 0.08, 0.04, 0.04, 0.04])
+    expected = [(returns[i:i + 3].mean() - 0.01) / returns[i:i + 3].std() for i in range(4)]
+    result = rolling_sharpe(returns, 3)
+    assert np.allclose(result[:4], expected)
+    assert np.isnan(result[4])
+    returns.flags.writeable = False
+    assert np.allclose(rolling_sharpe(returns, 3)[:4], expected)
+    with pytest.raises(TypeError, match="Window must be an integer."):
+        rolling_sharpe(returns, 2.7)
 
 def test_calculate_volatility():
     data = pd.Series([100, 105, 110, 115, 120])
@@ -143,4 +179,5 @@ if __name__ == "__main__":
     test_cagr()
     test_roi()
     test_sharpe_ratio()
+    test_rolling_sharpe()
     test_calculate_volatility()
\ No newline at end of file
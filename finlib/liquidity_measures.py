@@ -1,5 +1,8 @@
 import numpy as np
 
+from ._njit import NUMBA_AVAILABLE
+from ._numba_kernels import _effective_spread, _effective_spread_mid
+
 
 def quoted_spread(asks: np.ndarray, bids: np.ndarray) -> float:
     """Calculate the quoted bid-ask spread.
@@ -22,7 +25,7 @@ def quoted_spread(asks: np.ndarray, bids: np.ndarray) -> float:
         if len(asks) != len(bids):
             raise ValueError("Ask and bid arrays must have the same length")
 
-        return float(np.mean(asks - bids))
+        return float(np.subtract(asks, bids).mean())
     except TypeError as e:
         raise TypeError("Could not convert input to numpy array") from e
 
@@ -50,12 +53,28 @@ def effective_spread(prices: np.ndarray, bids: np.ndarray, asks: np.ndarray, tra
         if not (len(prices) == len(bids) == len(asks) == len(trade_directions)):
             raise ValueError("All input arrays must have the same length")
 
-        mid_prices = (bids + asks) / 2
-        return float(np.mean(2 * trade_directions * (prices - mid_prices)))
+        if NUMBA_AVAILABLE:
+            return float(_effective_spread(np.ascontiguousarray(prices, dtype=np.float64),
+                                           np.ascontiguousarray(bids, dtype=np.float64),
+                                           np.ascontiguousarray(asks, dtype=np.float64),
+                                           np.ascontiguousarray(trade_directions)))
+
+        # 2 * (p - (b + a) / 2) = 2p - b - a, reduced against the directions in one dot product
+        signed = np.asarray(trade_directions, dtype=np.float64)
+        return float(np.dot(signed, 2 * prices - bids - asks) / len(prices))
     except TypeError as e:
         raise TypeError("Could not convert input to numpy array") from e
 
 
+def _effective_spread_from_mid(prices: np.ndarray, mid_prices: np.ndarray, trade_directions: np.ndarray) -> float:
+    """Effective spread against precomputed, validated midpoints."""
+    if NUMBA_AVAILABLE:
+        return float(_effective_spread_mid(prices, mid_prices, np.ascontiguousarray(trade_directions)))
+
+    signed = np.asarray(trade_directions, dtype=np.float64)
+    return float(2 * np.dot(signed, prices - mid_prices) / len(prices))
+
+
 def test_quoted_spread():
     asks = np.array([101.5, 102.0, 102.5])
     bids = np.array([100.0, 100.5, 101.0])
@@ -75,4 +94,4 @@ def test_effective_spread():
 
 if __name__ == "__main__":
     test_quoted_spread()
-    test_effective_spread()
\ No newline at end of file
+    test_effective_spread()
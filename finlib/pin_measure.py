@@ -3,6 +3,8 @@ import math as math
 from scipy.optimize import minimize
 from scipy.special import gammaln
 
+from ._numba_kernels import _pin_nll_grad
+
 
 def pin_ekop(buys: np.ndarray, sells: np.ndarray) -> float:
     """
@@ -14,6 +16,10 @@ def pin_ekop(buys: np.ndarray, sells: np.ndarray) -> float:
 
     Returns:
         float: The estimated PIN value.
+
+    Raises:
+        TypeError: If buys or sells are not numpy arrays
+        ValueError: If input arrays are empty or have different lengths
     """
     if not isinstance(buys, np.ndarray) or not isinstance(sells, np.ndarray):
         raise TypeError("Input arrays must be numpy arrays")
@@ -21,29 +27,31 @@ def pin_ekop(buys: np.ndarray, sells: np.ndarray) -> float:
     if len(buys) == 0 or len(sells) == 0:
         raise ValueError("Input arrays cannot be empty")
 
-    def neg_log_likelihood(params: np.ndarray, buys: np.ndarray, sells: np.ndarray) -> float:
+    if len(buys) != len(sells):
+        raise ValueError("All input arrays must have the same length")
+
+    # Writable, contiguous float64 copies match the compiled likelihood signature
+    # (inputs such as Series.to_numpy() may be read-only)
+    buys = np.array(buys, dtype=np.float64, order='C')
+    sells = np.array(sells, dtype=np.float64, order='C')
+
+    # log(b!) + log(s!) summed over all days; it does not depend on the parameters
+    log_norm = float(np.sum(gammaln(buys + 1)) + np.sum(gammaln(sells + 1)))
+
+    def neg_log_likelihood(params: np.ndarray) -> tuple[float, np.ndarray]:
         alpha, mu, epsilon_b, epsilon_s = params
-        ll = 0
-        for b, s in zip(buys, sells):
-            if alpha == 0 or mu == 0 or epsilon_b == 0 or epsilon_s == 0:
-                continue  # Avoid log(0) or divide by zero
-            term1 = np.exp(-mu - epsilon_b) * (mu + epsilon_b) ** b / np.exp(gammaln(b + 1))
-            term2 = np.exp(-epsilon_s) * epsilon_s ** s / np.exp(gammaln(s + 1))
-            term3 = np.exp(-epsilon_b) * epsilon_b ** b / np.exp(gammaln(b + 1))
-            term4 = np.exp(-mu - epsilon_s) * (mu + epsilon_s) ** s / np.exp(gammaln(s + 1))
-            ll += np.log(
-                alpha * (term1 * term2 + term3 * term4) + (1 - alpha) * (term3 * term2)
-            )
-        return -ll
+        # Value and analytic gradient come from one pass over the data
+        return _pin_nll_grad(alpha, mu, epsilon_b, epsilon_s, buys, sells, log_norm)
 
     # Initial guesses for parameters
     params_init = np.array([0.2, 1, 1, 1])
 
-    # Bounds for parameters
-    bnds = ((0, 1), (0, None), (0, None), (0, None))
+    # Bounds for parameters, kept strictly inside the domain so every log term is finite
+    eps = 1e-8
+    bnds = ((eps, 1 - eps), (eps, None), (eps, None), (eps, None))
 
     # Optimization
-    result = minimize(neg_log_likelihood, params_init, args=(buys, sells), bounds=bnds, method='L-BFGS-B')
+    result = minimize(neg_log_likelihood, params_init, jac=True, bounds=bnds, method='L-BFGS-B')
 
     # Extract estimated parameters
     alpha_hat, mu_hat, epsilon_b_hat, epsilon_s_hat = result.x
@@ -65,5 +73,45 @@ def test_pin_ekop():
     print(f"Test passed. PIN value: {pin_value}")
 
 
+def test_pin_ekop_large_volumes():
+    # Daily counts well above 170 overflow exp(gammaln(k + 1)) outside log space
+    buys = np.array([1200, 1850, 1100, 2400, 1300, 1250])
+    sells = np.array([1150, 1200, 1900, 1180, 1220, 2300])
+    pin_value = pin_ekop(buys, sells)
+    assert np.isfinite(pin_value) and 0 < pin_value < 1, \
+        f"Expected a finite PIN in (0, 1), but got {pin_value}"
+
+
+def test_pin_ekop_length_mismatch():
+    import pytest
+
+    with pytest.raises(ValueError, match="All input arrays must have the same length"):
+        pin_ekop(np.array([5, 10, 15]), np.array([6, 9]))
+
+
+def test_pin_ekop_read_only():
+    buys = np.array([5, 10, 15], dtype=np.float64)
+    sells = np.array([6, 9, 14], dtype=np.float64)
+    expected = pin_ekop(buys, sells)
+    buys.flags.writeable = False
+    sells.flags.writeable = False
+    assert pin_ekop(buys, sells) == expected
+
+
+def test_pin_likelihood_gradient():
+    from scipy.optimize import check_grad
+
+    buys = np.array([5, 10, 15, 40, 12], dtype=np.float64)
+    sells = np.array([6, 9, 14, 11, 35], dtype=np.float64)
+    params = np.array([0.3, 12.0, 9.0, 8.0])
+    error = check_grad(lambda x: _pin_nll_grad(*x, buys, sells, 0.0)[0],
+                       lambda x: _pin_nll_grad(*x, buys, sells, 0.0)[1], params)
+    assert error < 1e-4, f"Analytic gradient differs from finite differences by {error}"
+
+
 if __name__ == "__main__":
     test_pin_ekop()
+    test_pin_ekop_large_volumes()
+    test_pin_ekop_length_mismatch()
+    test_pin_ekop_read_only()
+    test_pin_likelihood_gradient()
@@ -0,0 +1,126 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from .liquidity_measures import _effective_spread_from_mid, effective_spread
+from .trade_direction import _lee_ready_from_mid, lee_ready_direction
+
+
+class TickBatch(NamedTuple):
+    """Trades and their prevailing quotes stored as aligned, contiguous arrays.
+
+    The midpoint is computed once at construction so that trade classification
+    and spread measures on the same batch share it.
+
+    Attributes:
+        prices (np.ndarray): Array of transaction prices
+        bids (np.ndarray): Array of bid prices
+        asks (np.ndarray): Array of ask prices
+        mid (np.ndarray): Array of quote midpoints, (bids + asks) / 2
+    """
+    prices: np.ndarray
+    bids: np.ndarray
+    asks: np.ndarray
+    mid: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, prices, bids, asks, dtype=np.float64) -> "TickBatch":
+        """Build a batch from trade and quote arrays.
+
+        Args:
+            prices (array-like): Array of transaction prices
+            bids (array-like): Array of bid prices
+            asks (array-like): Array of ask prices
+            dtype (np.dtype, optional): Storage dtype. Defaults to float64;
+                float32 halves memory traffic but only keeps ~7 significant digits
+
+        Returns:
+            TickBatch: Batch holding the converted arrays and their midpoints
+
+        Raises:
+            ValueError: If input arrays are empty or have different lengths
+        """
+        prices = np.ascontiguousarray(prices, dtype=dtype)
+        bids = np.ascontiguousarray(bids, dtype=dtype)
+        asks = np.ascontiguousarray(asks, dtype=dtype)
+        if prices.size == 0 or bids.size == 0 or asks.size == 0:
+            raise ValueError("Input arrays cannot be empty")
+        if not (prices.size == bids.size == asks.size):
+            raise ValueError("All input arrays must have the same length")
+
+        mid = (bids + asks) / 2
+        return cls(prices, bids, asks, mid)
+
+    def lee_ready_direction(self) -> np.ndarray:
+        """Calculate trade direction using the Lee-Ready algorithm.
+
+        Returns:
+            np.ndarray: int8 array of trade directions (1: buy, -1: sell)
+        """
+        return _lee_ready_from_mid(self.prices, self.mid)
+
+    def effective_spread(self, trade_directions: np.ndarray) -> float:
+        """Calculate the effective spread of the batch.
+
+        Args:
+            trade_directions (array-like): Array of trade directions (+1 for buyer-initiated, -1 for seller-initiated)
+
+        Returns:
+            float: Mean effective spread
+
+        Raises:
+            ValueError: If trade_directions does not match the batch length
+        """
+        if len(trade_directions) != self.prices.size:
+            raise ValueError("Trade directions must have the same length as the batch")
+        return _effective_spread_from_mid(self.prices, self.mid, trade_directions)
+
+
+def analyze_trades(prices, bids, asks) -> tuple[np.ndarray, float]:
+    """Classify trades with the Lee-Ready algorithm and calculate their effective spread.
+
+    Equivalent to ``lee_ready_direction`` followed by ``effective_spread``, but both
+    steps share one TickBatch and therefore one midpoint array.
+
+    Args:
+        prices (array-like): Array of transaction prices
+        bids (array-like): Array of bid prices
+        asks (array-like): Array of ask prices
+
+    Returns:
+        tuple[np.ndarray, float]: int8 array of trade directions (1: buy, -1: sell)
+            and the mean effective spread
+
+    Raises:
+        ValueError: If input arrays are empty or have different lengths
+    """
+    batch = TickBatch.from_arrays(prices, bids, asks)
+    directions = batch.lee_ready_direction()
+    return directions, batch.effective_spread(directions)
+
+
+def test_tick_batch():
+    prices = np.array([100, 101, 100, 99, 100])
+    bids = np.array([99.5, 100.5, 99.5, 98.5, 99.5])
+    asks = np.array([100.5, 101.5, 100.5, 99.5, 100.5])
+    batch = TickBatch.from_arrays(prices, bids, asks)
+    directions = batch.lee_ready_direction()
+    assert np.array_equal(directions, np.array([0, 1, -1, -1, 1]))
+    mid_prices = (bids + asks) / 2
+    expected_spread = np.mean(2 * directions * (prices - mid_prices))
+    assert abs(batch.effective_spread(directions) - expected_spread) < 1e-10
+
+
+def test_analyze_trades():
+    prices = np.array([100, 101, 100, 99, 100, 100.25])
+    bids = np.array([99.5, 100.5, 99.5, 98.5, 99.5, 100.0])
+    asks = np.array([100.5, 101.5, 100.5, 99.5, 100.5, 100.5])
+    directions, spread = analyze_trades(prices, bids, asks)
+    expected_directions = lee_ready_direction(prices, bids, asks)
+    assert np.array_equal(directions, expected_directions)
+    assert abs(spread - effective_spread(prices, bids, asks, expected_directions)) < 1e-10
+
+
+if __name__ == "__main__":
+    test_tick_batch()
+    test_analyze_trades()
@@ -1,5 +1,8 @@
 import numpy as np
 
+from ._njit import NUMBA_AVAILABLE
+from ._numba_kernels import COMPILED, TICK_CHUNK_SIZE, _tick_direction, _tick_direction_chunked
+
 
 def tick_direction(prices: np.ndarray) -> np.ndarray:
     """Calculate trade direction using tick test.
@@ -8,7 +11,7 @@ def tick_direction(prices: np.ndarray) -> np.ndarray:
         prices (np.ndarray): Array of transaction prices
 
     Returns:
-        np.ndarray: Array of trade directions (1: uptick, -1: downtick, 0: undefined)
+        np.ndarray: int8 array of trade directions (1: uptick, -1: downtick, 0: undefined)
 
     Raises:
         TypeError: If prices cannot be converted to numpy array
@@ -19,26 +22,30 @@ def tick_direction(prices: np.ndarray) -> np.ndarray:
     if len(prices) == 0:
         raise ValueError("Prices array cannot be empty")
 
-    n = len(prices)
-    direction = np.zeros(n, dtype=int)
-
-    for i in range(1, n):
-        if prices[i] > prices[i - 1]:
-            direction[i] = 1  # uptick
-        elif prices[i] < prices[i - 1]:
-            direction[i] = -1  # downtick
-        else:  # zero tick
-            if i >= 2:
-                if prices[i - 1] > prices[i - 2]:
-                    direction[i] = 1  # zero-uptick
-                elif prices[i - 1] < prices[i - 2]:
-                    direction[i] = -1  # zero-downtick
-                else:
-                    direction[i] = direction[i - 1]  # propagate previous if two consecutive zeros
-            else:
-                direction[i] = direction[i - 1]  # propagate initial tick
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    if NUMBA_AVAILABLE and prices.size > TICK_CHUNK_SIZE:
+        # Long tapes are split into chunks processed across threads
+        return _tick_direction_chunked(prices, TICK_CHUNK_SIZE)
+    if COMPILED:
+        return _tick_direction(prices)
+    return _tick_direction_numpy(prices)
+
+
+def _tick_direction_numpy(prices: np.ndarray) -> np.ndarray:
+    """Loop-free tick test used when no compiled kernel is available.
+
+    A zero tick inherits the sign of the last non-zero tick, so the tick test
+    is a forward fill of the non-zero price-change signs.
+    """
+    later, earlier = prices[1:], prices[:-1]
+    d = (later > earlier).view(np.int8) - (later < earlier).view(np.int8)
+    # Index of the most recent non-zero tick at or before each position
+    idx = np.where(d != 0, np.arange(d.size), 0)
+    np.maximum.accumulate(idx, out=idx)
 
+    direction = np.empty(prices.size, dtype=np.int8)
     direction[0] = 0  # undefined for the first trade
+    direction[1:] = d[idx]
     return direction
 
 
@@ -51,7 +58,7 @@ def lee_ready_direction(prices: np.ndarray, bids: np.ndarray, asks: np.ndarray)
         asks (np.ndarray): Array of ask prices
 
     Returns:
-        np.ndarray: Array of trade directions (1: buy, -1: sell)
+        np.ndarray: int8 array of trade directions (1: buy, -1: sell)
 
     Raises:
         TypeError: If inputs cannot be converted to numpy arrays
@@ -64,21 +71,15 @@ def lee_ready_direction(prices: np.ndarray, bids: np.ndarray, asks: np.ndarray)
     if not (len(prices) == len(bids) == len(asks)):
         raise ValueError("All input arrays must have the same length")
 
-    n = len(prices)
-    mid_prices = (bids + asks) / 2
-    direction = np.zeros(n, dtype=int)
-
-    tick_directions = tick_direction(prices)
+    # Dividing by 2 is exact, so comparing against the midpoint matches 2p vs. b + a
+    return _lee_ready_from_mid(prices, (bids + asks) / 2)
 
-    for i in range(n):
-        if prices[i] > mid_prices[i]:
-            direction[i] = 1
-        elif prices[i] < mid_prices[i]:
-            direction[i] = -1
-        else:
-            direction[i] = tick_directions[i]
 
-    return direction
+def _lee_ready_from_mid(prices: np.ndarray, mid: np.ndarray) -> np.ndarray:
+    """Lee-Ready classification against precomputed, validated midpoints."""
+    tick_directions = tick_direction(prices)
+    quote_directions = (prices > mid).view(np.int8) - (prices < mid).view(np.int8)
+    return np.where(quote_directions != 0, quote_directions, tick_directions)
 
 
 def test_tick_test_direction():
@@ -90,6 +91,31 @@ def test_tick_test_direction():
     print("Test passed.")
 
 
+def test_tick_direction_numpy_fallback():
+    prices = np.array([100, 100, 101, 101, 101, 100, 100, 99, 100, 100], dtype=np.float64)
+    assert np.array_equal(_tick_direction_numpy(prices), _tick_direction(prices))
+    print("Fallback test passed.")
+
+
+def test_tick_direction_read_only():
+    prices = np.array([100, 101, 101, 100, 100, 99, 100], dtype=np.float64)
+    prices.flags.writeable = False
+    assert np.array_equal(tick_direction(prices), np.array([0, 1, 1, -1, -1, -1, 1]))
+    bids = prices - 0.5
+    asks = prices + 0.5
+    assert np.array_equal(lee_ready_direction(prices, bids, asks), np.array([0, 1, 1, -1, -1, -1, 1]))
+
+
+def test_tick_direction_chunked():
+    # Small chunks so zero-tick runs straddle chunk boundaries
+    prices = np.array([100, 100, 101, 101, 101, 101, 101, 100, 100, 100, 100, 99, 100, 100], dtype=np.float64)
+    for chunk_size in (1, 2, 3, 5, prices.size):
+        assert np.array_equal(_tick_direction_chunked(prices, chunk_size), _tick_direction(prices))
+    prices.flags.writeable = False
+    assert np.array_equal(_tick_direction_chunked(prices, 3), _tick_direction(prices))
+    print("Chunked test passed.")
+
+
 def test_lee_ready_direction():
     prices = np.array([100, 101, 100, 99, 100])
     bids = np.array([99.5, 100.5, 99.5, 98.5, 99.5])
@@ -103,4 +129,7 @@ def test_lee_ready_direction():
 
 if __name__ == "__main__":
     test_tick_test_direction()
+    test_tick_direction_numpy_fallback()
+    test_tick_direction_read_only()
+    test_tick_direction_chunked()
     test_lee_ready_direction()
@@ -1,5 +1,4 @@
 import numpy as np
-from statsmodels.tsa.stattools import acf
 
 
 def roll_model_analysis(prices: np.ndarray) -> dict[str, float]:
@@ -22,12 +21,11 @@ def roll_model_analysis(prices: np.ndarray) -> dict[str, float]:
         # Calculate price differences
         dp = np.diff(prices)
 
-        # Calculate autocovariance function
-        covdp = acf(dp, nlags=10, fft=False, adjusted=True)
-
-        # Extract first two autocovariance terms
-        gamma0 = covdp[0]
-        gamma1 = covdp[1]
+        # First two autocovariances of price changes (unbiased denominators)
+        dpm = dp - dp.mean()
+        n = dp.size
+        gamma0 = (dpm @ dpm) / n
+        gamma1 = (dpm[:-1] @ dpm[1:]) / (n - 1) if n > 1 else 0.0
 
         # Calculate Roll's measure of spread
         sig2u = gamma0 + 2 * gamma1
@@ -75,5 +73,16 @@ def test_roll_model_analysis():
     assert "Log-Normal Total Annualized Volatility" in result, "Missing 'Log-Normal Total Annualized Volatility' in result."
     print("Roll Model Analysis test passed.")
 
+
+def test_import_does_not_load_statsmodels():
+    import subprocess
+    import sys
+
+    # The Roll estimator only needs two autocovariances; keep finlib free of statsmodels' import cost
+    code = "import sys, finlib.volatility_measures; sys.exit('statsmodels' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0, \
+        "Importing finlib.volatility_measures loaded statsmodels"
+
 if __name__ == "__main__":
-    test_roll_model_analysis()
\ No newline at end of file
+    test_roll_model_analysis()
+    test_import_does_not_load_statsmodels()
\ No newline at end of file